@@ -0,0 +1,1401 @@
+#!/usr/bin/env python3
+"""
+PostgreSQL MCP Server for Cursor AI
+Provides tools for interacting with PostgreSQL databases from Cursor AI
+"""
+
+import asyncio
+import contextlib
+import decimal
+import functools
+import io
+import logging
+import os
+import re
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+import orjson
+from mcp.server import Server
+from mcp.server.models import InitializationOptions
+from mcp.server.stdio import stdio_server
+from mcp.types import (
+    CallToolRequest,
+    CallToolResult,
+    ListToolsRequest,
+    ListToolsResult,
+    Tool,
+    TextContent,
+    ImageContent,
+    EmbeddedResource,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Database driver: asyncpg (default) or psycopg2 for back-compat
+DB_DRIVER = os.environ.get("DB_DRIVER", "asyncpg").lower()
+
+# Imported by load_driver() on first connect so server start-up stays fast
+asyncpg = None
+psycopg2 = None
+
+try:
+    import uvloop
+except ImportError:  # optional, and unavailable on Windows
+    uvloop = None
+
+# Session settings for every pooled connection: JIT compilation only adds
+# latency to the short queries this server runs, and the server-side timeout
+# matches the client's command_timeout
+SERVER_SETTINGS = {
+    "jit": "off",
+    "application_name": "postgres-mcp-server",
+    "statement_timeout": "30000",
+}
+
+# Seconds an idle pooled connection is kept before asyncpg closes it; the
+# pool reopens connections on demand, so no reaper task is needed
+POOL_MAX_INACTIVE_LIFETIME = 300.0
+
+# Types exchanged as text, so JSON argument values bind the way psycopg2's
+# literals did and the server parses them ("42" into int, 42 into text, "true"
+# into boolean); asyncpg's binary codecs demand exact Python types. Each maps
+# to the decoder that keeps the Python type of result values
+TEXT_CODECS = {
+    "int2": int,
+    "int4": int,
+    "int8": int,
+    "float4": float,
+    "float8": float,
+    "numeric": decimal.Decimal,
+    "bool": lambda text: text == "t",
+    "text": str,
+    "varchar": str,
+    "bpchar": str,
+    "json": str,
+    "jsonb": str,
+    "date": str,
+    "time": str,
+    "timetz": str,
+    "timestamp": str,
+    "timestamptz": str,
+    "interval": str,
+}
+
+# Inserts larger than this use the COPY protocol instead of executemany
+COPY_THRESHOLD = 1000
+
+# SQLSTATE of COPY into a view; insert_data falls back to executemany
+WRONG_OBJECT_TYPE = "42809"
+
+# Most statements execute_query accepts in one queries batch
+MAX_BATCH_STATEMENTS = 100
+
+# Seconds a successful deep health check is reused before pinging again
+HEALTH_CACHE_TTL = 1.0
+
+# Cached list_tables/describe_table output: entry limit, and maximum age in
+# seconds to bound staleness from schema changes made by other clients
+SCHEMA_CACHE_SIZE = 256
+SCHEMA_CACHE_TTL = 30.0
+
+# Default rows fetched per round-trip when streaming a result set
+CURSOR_PREFETCH = 256
+
+# Rendered result tables are cut off, and fetching stops, beyond this many characters
+MAX_RESULT_CHARS = 64 * 1024
+
+# Catalog and probe queries issued on every call of their tools
+LIST_TABLES_SQL = """
+        SELECT table_name, table_type
+        FROM information_schema.tables 
+        WHERE table_schema = $1
+        ORDER BY table_name
+        """
+
+DESCRIBE_TABLE_SQL = """
+        SELECT 
+            column_name,
+            data_type,
+            is_nullable,
+            column_default,
+            character_maximum_length,
+            numeric_precision,
+            numeric_scale
+        FROM information_schema.columns 
+        WHERE table_schema = $1 AND table_name = $2
+        ORDER BY ordinal_position
+        """
+
+TABLE_INDEXES_SQL = """
+        SELECT
+            i.relname AS index_name,
+            ix.indisunique AS is_unique,
+            ix.indisprimary AS is_primary,
+            pg_get_indexdef(ix.indexrelid) AS definition
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_class t ON t.oid = ix.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = $1 AND t.relname = $2
+        ORDER BY i.relname
+        """
+
+TABLE_CONSTRAINTS_SQL = """
+        SELECT
+            c.conname AS constraint_name,
+            CASE c.contype
+                WHEN 'p' THEN 'PRIMARY KEY'
+                WHEN 'f' THEN 'FOREIGN KEY'
+                WHEN 'u' THEN 'UNIQUE'
+                WHEN 'c' THEN 'CHECK'
+                WHEN 'x' THEN 'EXCLUDE'
+                ELSE c.contype::text
+            END AS constraint_type,
+            pg_get_constraintdef(c.oid) AS definition
+        FROM pg_constraint c
+        JOIN pg_class t ON t.oid = c.conrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = $1 AND t.relname = $2
+        ORDER BY c.conname
+        """
+
+CONNECTION_INFO_SQL = "SELECT current_database(), current_user, version()"
+
+HEALTH_SQL = "SELECT 1"
+
+# Statements the psycopg2 fallback keeps server-side prepared per session;
+# asyncpg's statement cache covers these automatically
+PREPARED_SQL = frozenset({
+    LIST_TABLES_SQL,
+    DESCRIBE_TABLE_SQL,
+    TABLE_INDEXES_SQL,
+    TABLE_CONSTRAINTS_SQL,
+    CONNECTION_INFO_SQL,
+    HEALTH_SQL,
+})
+
+# asyncpg-style positional parameter ($1, $2, ...)
+_PARAM_RE = re.compile(r"\$(\d+)")
+
+# Start of any ;-separated statement, past leading whitespace and comments.
+# Each repeated alternative can match a given text only one way, so a failed
+# search cannot backtrack exponentially over long whitespace or comment runs
+_STATEMENT_START = r"(?:^|;)(?:\s|--[^\n]*(?:\n|$)|/\*(?:[^*]|\*(?!/))*\*/)*"
+
+# Statements execute_query refuses to run without confirm_destructive; every
+# statement is checked because the simple query protocol runs a whole script
+_DESTRUCTIVE_SQL_RE = re.compile(_STATEMENT_START + r"(DROP|TRUNCATE|DELETE)\b", re.IGNORECASE)
+
+# Statements after which cached schema descriptions may be stale, found at the
+# start of any statement of a script
+_SCHEMA_CHANGE_SQL_RE = re.compile(_STATEMENT_START + r"(CREATE|ALTER|DROP|COMMENT)\b", re.IGNORECASE)
+
+# Statements the psycopg2 fallback can read through a server-side cursor
+_CURSOR_SQL_RE = re.compile(r"^\s*(SELECT|VALUES|TABLE)\b", re.IGNORECASE)
+
+
+def load_driver() -> None:
+    """Import the configured database driver if it is not loaded yet"""
+    global asyncpg, psycopg2
+    if DB_DRIVER == "psycopg2":
+        if psycopg2 is None:
+            import psycopg2
+            import psycopg2.extras
+            import psycopg2.pool
+            import psycopg2.sql
+    elif asyncpg is None:
+        import asyncpg
+
+
+async def init_connection(conn) -> None:
+    """Pool init hook: exchange TEXT_CODECS types with the server as text"""
+    for type_name, decoder in TEXT_CODECS.items():
+        await conn.set_type_codec(type_name, encoder=text_value, decoder=decoder, schema="pg_catalog", format="text")
+
+
+def quote_ident(name: str) -> str:
+    """Quote an SQL identifier, doubling any embedded quotes"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def qualified_name(schema: str, name: str) -> str:
+    """Quoted schema-qualified name for use in dynamic SQL"""
+    return f"{quote_ident(schema)}.{quote_ident(name)}"
+
+
+@functools.lru_cache(maxsize=128)
+def row_template(ncols: int) -> str:
+    """Format string rendering one result row, cached per column count"""
+    return "\n" + " | ".join(["{:>15}"] * ncols)
+
+
+@functools.lru_cache(maxsize=128)
+def table_header(columns: Tuple[str, ...]) -> str:
+    """Header and separator lines of a result table, cached per column set"""
+    header = " | ".join(f"{col:>15}" for col in columns)
+    return header + "\n" + "-" * len(header)
+
+
+@functools.lru_cache(maxsize=128)
+def column_definitions(spec: Tuple[tuple, ...]) -> str:
+    """Column list of a CREATE TABLE statement, cached per normalized column spec
+
+    Each entry of spec is (name, type, not_null, default, primary_key).
+    """
+    column_defs = []
+    for name, col_type, not_null, default, primary_key in spec:
+        col_def = f"{quote_ident(name)} {col_type}"
+        if not_null:
+            col_def += " NOT NULL"
+        if default:
+            col_def += f" DEFAULT {default}"
+        if primary_key:
+            col_def += " PRIMARY KEY"
+        column_defs.append(col_def)
+    return ", ".join(column_defs)
+
+
+@functools.lru_cache(maxsize=128)
+def insert_sql(schema: str, table: str, columns: Tuple[str, ...], on_conflict: Optional[str] = None) -> str:
+    """Parameterized INSERT statement for one row, cached per table and column set"""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    column_list = ", ".join(map(quote_ident, columns))
+    query = f"INSERT INTO {qualified_name(schema, table)} ({column_list}) VALUES ({placeholders})"
+    if on_conflict:
+        query += f" ON CONFLICT {on_conflict}"
+    return query
+
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def text_value(value: Any) -> str:
+    """PostgreSQL text input for a JSON argument value"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return to_json(value)
+    return str(value)
+
+
+def copy_field(value: Any) -> str:
+    """One value in COPY's text format, rendered as text_value() binds it"""
+    if value is None:
+        return "\\N"
+    return text_value(value).translate(_COPY_ESCAPES)
+
+
+def copy_text(records: List[tuple]) -> bytes:
+    """Rows as COPY text-format input, leaving type coercion to the server"""
+    return "".join("\t".join(map(copy_field, record)) + "\n" for record in records).encode()
+
+
+def to_json(obj: Any) -> str:
+    """Serialize to JSON, stringifying values orjson has no native encoding for"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def text_result(text: str) -> CallToolResult:
+    """Tool result carrying a single text block"""
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+# Fixed replies, built once and shared between calls
+_NO_CONNECTIONS_RESULT = text_result("No active connections")
+_NO_DATA_RESULT = text_result("No data provided")
+_QUERY_OR_QUERIES_RESULT = text_result("Provide either query or queries")
+_BATCH_LIMIT_RESULT = text_result(f"A batch is limited to {MAX_BATCH_STATEMENTS} statements")
+_DESTRUCTIVE_RESULT = text_result(
+    "Refusing to run a DROP, TRUNCATE or DELETE statement without confirm_destructive=true"
+)
+_SIMPLE_PARAMS_RESULT = text_result("Parameters cannot be bound with the simple query protocol")
+
+
+def table_text(columns, count: int, body: str, limit: Optional[int] = None) -> str:
+    """Reply for a result set whose count rows are already rendered into body"""
+    if not count:
+        return "Query executed successfully. No rows returned."
+    
+    result_text = f"Query executed successfully. {count} rows returned:\n\n"
+    result_text += table_header(tuple(columns))
+    result_text += body
+    
+    if len(body) >= MAX_RESULT_CHARS:
+        result_text += (
+            f"\n\n(Output truncated at {MAX_RESULT_CHARS} characters after {count} rows; "
+            "use a smaller limit, offset or narrower query to see more)"
+        )
+    elif count == limit:
+        result_text += f"\n\n(Results limited to {limit} rows)"
+    return result_text
+
+
+def affected_rows(status: str) -> int:
+    """Extract the row count from a command status tag such as 'UPDATE 3'"""
+    count = status.rsplit(" ", 1)[-1] if status else ""
+    return int(count) if count.isdigit() else -1
+
+
+class Psycopg2Connection:
+    """asyncpg-compatible wrapper around a psycopg2 connection
+
+    Used when DB_DRIVER=psycopg2. Queries use asyncpg-style $n placeholders and
+    blocking driver calls run in a worker thread so the event loop stays free.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._conn.autocommit = True
+        # Query text -> name of its server-side prepared statement
+        self._prepared: Dict[str, str] = {}
+        # Reused for every statement; the pool hands a connection to one task at a time
+        self._cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+        # Depth of open nested transaction blocks
+        self._savepoints = 0
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """Run the enclosed statements in one transaction, like asyncpg's
+
+        Blocks nested inside an open transaction use a savepoint.
+        """
+        if not self._conn.autocommit:
+            self._savepoints += 1
+            name = f"mcp_savepoint_{self._savepoints}"
+            await asyncio.to_thread(self._cursor.execute, f"SAVEPOINT {name}")
+            try:
+                yield
+                await asyncio.to_thread(self._cursor.execute, f"RELEASE SAVEPOINT {name}")
+            except BaseException:
+                await asyncio.to_thread(self._cursor.execute, f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            finally:
+                self._savepoints -= 1
+            return
+        
+        self._conn.autocommit = False
+        try:
+            yield
+            await asyncio.to_thread(self._conn.commit)
+        except BaseException:
+            await asyncio.to_thread(self._conn.rollback)
+            raise
+        finally:
+            self._conn.autocommit = True
+
+    @staticmethod
+    def _param_order(query: str) -> Tuple[str, List[int]]:
+        """Rewrite $n placeholders to %s and return the argument order"""
+        order: List[int] = []
+
+        def replace(match):
+            order.append(int(match.group(1)) - 1)
+            return "%s"
+
+        return _PARAM_RE.sub(replace, query.replace("%", "%%")), order
+
+    def _bind(self, cursor, query: str, args: tuple):
+        """Translate a $n query into a psycopg2 query and argument list"""
+        if query in PREPARED_SQL:
+            name = self._prepared.get(query)
+            if name is None:
+                name = f"mcp_stmt_{len(self._prepared)}"
+                # PREPARE takes $n placeholders as-is
+                cursor.execute(f"PREPARE {name} AS {query}")
+                self._prepared[query] = name
+            if args:
+                return f"EXECUTE {name} ({', '.join(['%s'] * len(args))})", list(args)
+            return f"EXECUTE {name}", None
+        if args:
+            query, order = self._param_order(query)
+            return query, [args[i] for i in order]
+        return query, None
+
+    def _execute(self, query: str, args: tuple, fetch: bool, limit: Optional[int] = None):
+        cursor = self._cursor
+        cursor.execute(*self._bind(cursor, query, args))
+        columns = [desc[0] for desc in cursor.description] if cursor.description else None
+        rows = []
+        if fetch and columns:
+            rows = cursor.fetchmany(limit) if limit is not None else cursor.fetchall()
+        return columns, rows, cursor.statusmessage
+
+    async def _stream(self, query: str, args: tuple, limit: Optional[int], on_row, prefetch: int):
+        """Read a query through a named server-side cursor, prefetch rows at a time
+
+        Only the rows actually fetched cross the wire, instead of the whole
+        result set a client-side cursor would transfer.
+        """
+        if args:
+            query, order = self._param_order(query)
+            args = [args[i] for i in order]
+        else:
+            args = None
+
+        count = 0
+        stopped = False
+        # Named cursors only exist inside a transaction
+        async with self.transaction():
+            cursor = self._conn.cursor(name="mcp_cursor", cursor_factory=psycopg2.extras.DictCursor)
+            try:
+                await asyncio.to_thread(cursor.execute, query, args)
+                while not stopped and (limit is None or count < limit):
+                    size = prefetch if limit is None else min(prefetch, limit - count)
+                    rows = await asyncio.to_thread(cursor.fetchmany, size)
+                    for row in rows:
+                        count += 1
+                        if on_row(row):
+                            stopped = True
+                            break
+                    if len(rows) < size:
+                        break
+                # A named cursor's description is only known after the first fetch
+                columns = [desc[0] for desc in cursor.description] if cursor.description else None
+            finally:
+                cursor.close()
+        return columns, count, None
+
+    async def run_query(self, query: str, args: tuple, fetch: bool, limit: Optional[int], on_row,
+                        prefetch: int = CURSOR_PREFETCH):
+        """Execute a query, passing up to limit rows to on_row
+
+        Returns (columns, row_count, status) like PostgreSQLMCPServer._run_query.
+        """
+        if fetch and query not in PREPARED_SQL and _CURSOR_SQL_RE.match(query):
+            return await self._stream(query, args, limit, on_row, prefetch)
+
+        columns, rows, status = await asyncio.to_thread(self._execute, query, args, fetch, limit)
+        count = 0
+        for row in rows:
+            count += 1
+            if on_row(row):
+                break
+        return columns, count, status
+
+    async def execute(self, query: str, *args) -> str:
+        _, _, status = await asyncio.to_thread(self._execute, query, args, False)
+        return status
+
+    async def fetch(self, query: str, *args) -> list:
+        _, rows, _ = await asyncio.to_thread(self._execute, query, args, True)
+        return rows
+
+    async def fetchrow(self, query: str, *args):
+        rows = await self.fetch(query, *args)
+        return rows[0] if rows else None
+
+    async def fetchval(self, query: str, *args, column: int = 0):
+        row = await self.fetchrow(query, *args)
+        return row[column] if row is not None else None
+
+    def _executemany(self, command: str, args: list):
+        command, order = self._param_order(command)
+        psycopg2.extras.execute_batch(self._cursor, command, [[row[i] for i in order] for row in args], page_size=1000)
+
+    async def executemany(self, command: str, args: list) -> None:
+        await asyncio.to_thread(self._executemany, command, args)
+
+    def _copy_to_table(self, table_name: str, source, columns: List[str], schema_name: str):
+        query = psycopg2.sql.SQL("COPY {}.{} ({}) FROM STDIN").format(
+            psycopg2.sql.Identifier(schema_name),
+            psycopg2.sql.Identifier(table_name),
+            psycopg2.sql.SQL(", ").join(map(psycopg2.sql.Identifier, columns)),
+        )
+        self._cursor.copy_expert(query, source)
+        return f"COPY {self._cursor.rowcount}"
+
+    async def copy_to_table(self, table_name: str, *, source, columns: List[str],
+                            schema_name: str = "public") -> str:
+        """Bulk load text-format COPY input read from the file-like source"""
+        return await asyncio.to_thread(self._copy_to_table, table_name, source, columns, schema_name)
+
+    def is_closed(self) -> bool:
+        return self._conn.closed != 0
+
+
+class Psycopg2Pool:
+    """asyncpg.Pool-compatible wrapper around a psycopg2 ThreadedConnectionPool"""
+
+    def __init__(self, pool, max_size: int):
+        self._pool = pool
+        # ThreadedConnectionPool raises when exhausted; wait for a free slot instead
+        self._slots = asyncio.Semaphore(max_size)
+        # One wrapper per pooled connection so per-session state survives release
+        self._wrappers: Dict[Any, Psycopg2Connection] = {}
+
+    @classmethod
+    async def create(cls, min_size: int, max_size: int, **kwargs) -> "Psycopg2Pool":
+        """Open a new psycopg2 connection pool"""
+        pool = await asyncio.to_thread(psycopg2.pool.ThreadedConnectionPool, min_size, max_size, **kwargs)
+        return cls(pool, max_size)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        async with self._slots:
+            conn = await asyncio.to_thread(self._pool.getconn)
+            wrapper = self._wrappers.get(conn)
+            if wrapper is None:
+                wrapper = self._wrappers[conn] = Psycopg2Connection(conn)
+            try:
+                yield wrapper
+            finally:
+                if conn.closed:
+                    del self._wrappers[conn]
+                self._pool.putconn(conn, close=conn.closed != 0)
+
+    def get_size(self) -> int:
+        """Open connections in the pool, idle or in use, like asyncpg's"""
+        connections = [*self._pool._pool, *self._pool._used.values()]
+        return sum(1 for conn in connections if not conn.closed)
+
+    async def close(self) -> None:
+        self._wrappers.clear()
+        await asyncio.to_thread(self._pool.closeall)
+
+class PostgreSQLMCPServer:
+    """MCP Server for PostgreSQL database operations"""
+    
+    __slots__ = (
+        "server", "pools", "_schema_cache", "_health_checked",
+        "connection_info", "_dispatch", "_tools_result",
+    )
+    
+    def __init__(self):
+        self.server = Server("postgres-mcp-server")
+        # asyncpg.Pool (or Psycopg2Pool) per connection name
+        self.pools: Dict[str, Any] = {}
+        # (connection name, ...) -> (loop time, rendered text), in LRU order
+        self._schema_cache: OrderedDict = OrderedDict()
+        # Loop time of the last successful deep health check per connection
+        self._health_checked: Dict[str, float] = {}
+        # (database, user, version) per connection; fixed for the pool's lifetime
+        self.connection_info: Dict[str, Tuple[str, str, str]] = {}
+        self._dispatch = {
+            "postgres_connect": self.connect_database,
+            "postgres_disconnect": self.disconnect_database,
+            "postgres_list_connections": self.list_connections,
+            "postgres_execute_query": self.execute_query,
+            "postgres_list_tables": self.list_tables,
+            "postgres_describe_table": self.describe_table,
+            "postgres_table_data": self.get_table_data,
+            "postgres_create_table": self.create_table,
+            "postgres_drop_table": self.drop_table,
+            "postgres_insert_data": self.insert_data,
+            "postgres_update_data": self.update_data,
+            "postgres_delete_data": self.delete_data,
+            "postgres_backup_table": self.backup_table,
+            "postgres_health_check": self.health_check,
+        }
+        self.setup_tools()
+    
+    def setup_tools(self):
+        """Register all available tools"""
+        
+        # The tool list is static, so build it once and hand out the same object
+        self._tools_result = ListToolsResult(
+            tools=[
+                Tool(
+                    name="postgres_connect",
+                    description="Connect to a PostgreSQL database",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "host": {"type": "string", "description": "Database host"},
+                            "port": {"type": "integer", "description": "Database port", "default": 5432},
+                            "database": {"type": "string", "description": "Database name"},
+                            "user": {"type": "string", "description": "Username"},
+                            "password": {"type": "string", "description": "Password"},
+                            "connection_name": {"type": "string", "description": "Name for this connection", "default": "default"},
+                            "min_size": {"type": "integer", "description": "Connections the pool keeps open", "default": 2},
+                            "max_size": {"type": "integer", "description": "Maximum connections in the pool", "default": 20}
+                        },
+                        "required": ["host", "database", "user", "password"]
+                    }
+                ),
+                Tool(
+                    name="postgres_disconnect",
+                    description="Disconnect from a PostgreSQL database",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "connection_name": {"type": "string", "description": "Connection name to disconnect", "default": "default"}
+                        }
+                    }
+                ),
+                Tool(
+                    name="postgres_list_connections",
+                    description="List all active database connections",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {}
+                    }
+                ),
+                Tool(
+                    name="postgres_execute_query",
+                    description="Execute a SQL query on the database",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "SQL query to execute"},
+                            "queries": {"type": "array", "description": f"Up to {MAX_BATCH_STATEMENTS} statements run atomically in one round-trip instead of query; returns no rows", "items": {"type": "string"}},
+                            "params": {"type": "array", "description": "Values bound to $1, $2, ... placeholders in the query", "items": {}},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "fetch_results": {"type": "boolean", "description": "Whether to fetch and return results", "default": True},
+                            "limit": {"type": "integer", "description": "Limit number of results returned", "default": 1000},
+                            "fetch_size": {"type": "integer", "description": "Rows fetched from the server per round-trip", "default": CURSOR_PREFETCH},
+                            "simple": {"type": "boolean", "description": "Use the simple query protocol: no prepare step, allows several statements, returns no rows", "default": False},
+                            "format": {"type": "string", "enum": ["table", "json"], "description": "Render rows as a text table or as JSON arrays in column order", "default": "table"},
+                            "confirm_destructive": {"type": "boolean", "description": "Allow DROP, TRUNCATE and DELETE statements", "default": False}
+                        },
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="postgres_list_tables",
+                    description="List all tables in the database",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"}
+                        }
+                    }
+                ),
+                Tool(
+                    name="postgres_describe_table",
+                    description="Get detailed information about a table structure, including indexes and constraints",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"}
+                        },
+                        "required": ["table_name"]
+                    }
+                ),
+                Tool(
+                    name="postgres_table_data",
+                    description="Get data from a table with optional filtering",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"},
+                            "limit": {"type": "integer", "description": "Number of rows to return", "default": 100},
+                            "offset": {"type": "integer", "description": "Number of rows to skip", "default": 0},
+                            "where_clause": {"type": "string", "description": "WHERE clause for filtering"},
+                            "order_by": {"type": "string", "description": "ORDER BY clause"}
+                        },
+                        "required": ["table_name"]
+                    }
+                ),
+                Tool(
+                    name="postgres_create_table",
+                    description="Create a new table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "columns": {"type": "array", "description": "Column definitions", "items": {"type": "object"}},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"},
+                            "if_not_exists": {"type": "boolean", "description": "Use IF NOT EXISTS", "default": True}
+                        },
+                        "required": ["table_name", "columns"]
+                    }
+                ),
+                Tool(
+                    name="postgres_drop_table",
+                    description="Drop a table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"},
+                            "cascade": {"type": "boolean", "description": "Use CASCADE", "default": False},
+                            "if_exists": {"type": "boolean", "description": "Use IF EXISTS", "default": True}
+                        },
+                        "required": ["table_name"]
+                    }
+                ),
+                Tool(
+                    name="postgres_insert_data",
+                    description="Insert data into a table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "data": {"type": "array", "description": "Data to insert", "items": {"type": "object"}},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"},
+                            "on_conflict": {"type": "string", "description": "ON CONFLICT action (DO NOTHING, DO UPDATE)"}
+                        },
+                        "required": ["table_name", "data"]
+                    }
+                ),
+                Tool(
+                    name="postgres_update_data",
+                    description="Update data in a table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "data": {"type": "object", "description": "Data to update"},
+                            "where_clause": {"type": "string", "description": "WHERE clause for filtering"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"}
+                        },
+                        "required": ["table_name", "data", "where_clause"]
+                    }
+                ),
+                Tool(
+                    name="postgres_delete_data",
+                    description="Delete data from a table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "where_clause": {"type": "string", "description": "WHERE clause for filtering"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"}
+                        },
+                        "required": ["table_name", "where_clause"]
+                    }
+                ),
+                Tool(
+                    name="postgres_backup_table",
+                    description="Create a backup of a table",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "table_name": {"type": "string", "description": "Name of the table"},
+                            "backup_table_name": {"type": "string", "description": "Name for backup table"},
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "schema": {"type": "string", "description": "Schema name", "default": "public"}
+                        },
+                        "required": ["table_name", "backup_table_name"]
+                    }
+                ),
+                Tool(
+                    name="postgres_health_check",
+                    description="Check database connection health",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "connection_name": {"type": "string", "description": "Connection name", "default": "default"},
+                            "deep": {"type": "boolean", "description": "Run a query against the server; otherwise only local pool state is reported", "default": False}
+                        }
+                    }
+                )
+            ]
+        )
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> ListToolsResult:
+            """List all available PostgreSQL tools"""
+            return self._tools_result
+        
+        @self.server.call_tool()
+        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+            """Handle tool calls"""
+            handler = self._dispatch.get(name)
+            if handler is None:
+                return text_result(f"Unknown tool: {name}")
+            try:
+                return await handler(arguments)
+            except Exception as e:
+                logger.error(f"Error executing tool {name}: {e}")
+                return text_result(f"Error: {str(e)}")
+    
+    async def connect_database(self, args: Dict[str, Any]) -> CallToolResult:
+        """Connect to a PostgreSQL database"""
+        connection_name = args.get("connection_name", "default")
+        
+        try:
+            params = {
+                "host": args["host"],
+                "port": args.get("port", 5432),
+                "database": args["database"],
+                "user": args["user"],
+                "password": args["password"],
+            }
+            min_size = args.get("min_size", 2)
+            max_size = args.get("max_size", 20)
+            load_driver()
+            if DB_DRIVER == "psycopg2":
+                pool = await Psycopg2Pool.create(
+                    min_size=min_size,
+                    max_size=max_size,
+                    application_name=SERVER_SETTINGS["application_name"],
+                    options=" ".join(
+                        f"-c {name}={value}" for name, value in SERVER_SETTINGS.items() if name != "application_name"
+                    ),
+                    **params
+                )
+            else:
+                pool = await asyncpg.create_pool(
+                    min_size=min_size,
+                    max_size=max_size,
+                    command_timeout=30,
+                    statement_cache_size=1024,
+                    max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+                    server_settings=SERVER_SETTINGS,
+                    init=init_connection,
+                    **params
+                )
+            
+            try:
+                async with pool.acquire() as conn:
+                    info = tuple(await conn.fetchrow(CONNECTION_INFO_SQL))
+            except Exception:
+                await pool.close()
+                raise
+            
+            # Replace an existing pool of the same name instead of leaking it
+            if connection_name in self.pools:
+                await self.pools.pop(connection_name).close()
+            self.pools[connection_name] = pool
+            self._health_checked.pop(connection_name, None)
+            self._invalidate_schema(connection_name)
+            self.connection_info[connection_name] = info
+            logger.info(f"Connected to database {args['database']} on {args['host']}")
+            
+            return text_result(
+                f"Successfully connected to database '{args['database']}' on {args['host']}:{args.get('port', 5432)} as '{args['user']}'"
+            )
+        except Exception as e:
+            return text_result(f"Failed to connect: {str(e)}")
+    
+    async def disconnect_database(self, args: Dict[str, Any]) -> CallToolResult:
+        """Disconnect from a PostgreSQL database"""
+        connection_name = args.get("connection_name", "default")
+        
+        if connection_name in self.pools:
+            self.connection_info.pop(connection_name, None)
+            self._health_checked.pop(connection_name, None)
+            self._invalidate_schema(connection_name)
+            await self.pools.pop(connection_name).close()
+            return text_result(f"Disconnected from '{connection_name}'")
+        else:
+            return text_result(f"No connection found for '{connection_name}'")
+    
+    async def list_connections(self, args: Dict[str, Any]) -> CallToolResult:
+        """List all active connections"""
+        if not self.pools:
+            return _NO_CONNECTIONS_RESULT
+        
+        # Served from the info captured at connect time, no round-trips needed
+        connections_info = [
+            f"- {name}: {db_name} as {user}"
+            for name, (db_name, user, version) in self.connection_info.items()
+        ]
+        
+        return text_result("Active connections:\n" + "\n".join(connections_info))
+    
+    async def _stream_rows(self, conn, query: str, params: tuple, limit: Optional[int], on_row, prefetch: int):
+        """Read a row-returning query through a cursor, prefetch rows at a time
+
+        conn.cursor() goes through the connection's statement cache, so a
+        repeated query skips the Parse/Describe round-trip.
+        """
+        columns: List[str] = []
+        count = 0
+        # Cursors need a transaction
+        async with conn.transaction():
+            async for record in conn.cursor(query, *params, prefetch=prefetch):
+                if not count:
+                    columns = list(record.keys())
+                count += 1
+                if on_row(record) or count == limit:
+                    break
+        if not count:
+            # No record to take names from; describing the statement costs a
+            # round-trip, but only for empty results
+            stmt = await conn.prepare(query)
+            columns = [attr.name for attr in stmt.get_attributes()]
+        return columns, count, None
+    
+    async def _run_query(self, conn, query: str, params: tuple, fetch: bool, limit: Optional[int], on_row,
+                         prefetch: int = CURSOR_PREFETCH):
+        """Execute a query, streaming up to limit result rows to on_row
+
+        on_row may return True to stop reading further rows. Returns
+        (columns, row_count, status). columns is None when the statement does
+        not produce a result set; status is None when it does.
+        """
+        if isinstance(conn, Psycopg2Connection):
+            return await conn.run_query(query, params, fetch, limit, on_row, prefetch)
+        
+        if not fetch:
+            return None, 0, await conn.execute(query, *params)
+        
+        if _CURSOR_SQL_RE.match(query):
+            try:
+                return await self._stream_rows(conn, query, params, limit, on_row, prefetch)
+            except asyncpg.InvalidCachedStatementError:
+                # A schema change invalidated the cached plan; asyncpg cannot
+                # retry inside the cursor's transaction, so drop the cache and retry once
+                await conn.reload_schema_state()
+                return await self._stream_rows(conn, query, params, limit, on_row, prefetch)
+        
+        # Other statements may or may not return rows; prepare to find out and
+        # so that those without a result set report their status
+        stmt = await conn.prepare(query)
+        attributes = stmt.get_attributes()
+        if not attributes:
+            await stmt.fetch(*params)
+            return None, 0, stmt.get_statusmsg()
+        
+        count = 0
+        async with conn.transaction():
+            async for record in stmt.cursor(*params, prefetch=prefetch):
+                count += 1
+                if on_row(record) or count == limit:
+                    break
+        return [attr.name for attr in attributes], count, None
+    
+    def _cached_schema(self, key: tuple) -> Optional[str]:
+        """Rendered catalog output for key, if cached and still fresh"""
+        entry = self._schema_cache.get(key)
+        if entry is None:
+            return None
+        stored, text = entry
+        if asyncio.get_running_loop().time() - stored >= SCHEMA_CACHE_TTL:
+            del self._schema_cache[key]
+            return None
+        self._schema_cache.move_to_end(key)
+        return text
+    
+    def _store_schema(self, key: tuple, text: str) -> None:
+        """Cache rendered catalog output, evicting the least recently used entry"""
+        self._schema_cache[key] = (asyncio.get_running_loop().time(), text)
+        if len(self._schema_cache) > SCHEMA_CACHE_SIZE:
+            self._schema_cache.popitem(last=False)
+    
+    def _invalidate_schema(self, connection_name: str) -> None:
+        """Drop cached catalog output for a connection after DDL"""
+        for key in [key for key in self._schema_cache if key[0] == connection_name]:
+            del self._schema_cache[key]
+    
+    def _pool(self, connection_name: str):
+        """Look up the pool for connection_name"""
+        pool = self.pools.get(connection_name)
+        if pool is None:
+            raise LookupError(f"No connection found for '{connection_name}'")
+        return pool
+    
+    async def _exec(self, connection_name: str, query: str, params: tuple = (), fetch: bool = True,
+                    limit: Optional[int] = None, on_row=None, prefetch: int = CURSOR_PREFETCH):
+        """Run a query on a pooled connection for connection_name
+
+        Returns (columns, row_count, status) as _run_query does.
+        """
+        async with self._pool(connection_name).acquire() as conn:
+            return await self._run_query(conn, query, params, fetch, limit, on_row or (lambda row: None), prefetch)
+    
+    async def _query_text(self, connection_name: str, query: str, params: tuple = (), fetch: bool = True,
+                          limit: Optional[int] = None, prefetch: int = CURSOR_PREFETCH,
+                          output_format: str = "table") -> str:
+        """Run a query and render its result as a text table or JSON"""
+        if output_format == "json":
+            return await self._query_json(connection_name, query, params, fetch, limit, prefetch)
+        
+        # Format rows as they arrive instead of holding the result set
+        body = io.StringIO()
+        row_format = None
+        
+        def write_row(row):
+            nonlocal row_format
+            if row_format is None:
+                # One format call per row instead of one f-string per cell
+                row_format = row_template(len(row))
+            body.write(row_format.format(*map(str, row)))
+            # Tool results cannot be streamed, so stop fetching once the reply is full
+            return body.tell() >= MAX_RESULT_CHARS
+        
+        columns, count, status = await self._exec(connection_name, query, params, fetch, limit, write_row, prefetch)
+        
+        if columns is None:
+            return f"Query executed successfully. {affected_rows(status)} rows affected."
+        
+        return table_text(columns, count, body.getvalue(), limit)
+    
+    async def _fetch_text(self, connection_name: str, query: str, params: tuple = ()) -> str:
+        """Run a small catalog query and render its result as a text table
+
+        conn.fetch() is a single round-trip through the statement cache,
+        without the transaction and portal the cursor path needs.
+        """
+        async with self._pool(connection_name).acquire() as conn:
+            rows = await conn.fetch(query, *params)
+        if not rows:
+            return table_text((), 0, "")
+        
+        row_format = row_template(len(rows[0]))
+        body = io.StringIO()
+        count = 0
+        for row in rows:
+            body.write(row_format.format(*map(str, row)))
+            count += 1
+            if body.tell() >= MAX_RESULT_CHARS:
+                break
+        return table_text(list(rows[0].keys()), count, body.getvalue())
+    
+    async def _query_json(self, connection_name: str, query: str, params: tuple = (), fetch: bool = True,
+                          limit: Optional[int] = None, prefetch: int = CURSOR_PREFETCH) -> str:
+        """Run a query and render its result as a JSON document"""
+        # Encode each row as it arrives and join the pieces into the rows array.
+        # Rows are arrays in columns order, so duplicate column names survive
+        body = io.BytesIO()
+        body.write(b"[")
+        
+        def write_row(row):
+            if body.tell() > 1:
+                body.write(b",")
+            body.write(orjson.dumps(tuple(row), default=str))
+            return body.tell() >= MAX_RESULT_CHARS
+        
+        columns, count, status = await self._exec(connection_name, query, params, fetch, limit, write_row, prefetch)
+        
+        if columns is None:
+            return to_json({"rows_affected": affected_rows(status)})
+        
+        truncated = body.tell() >= MAX_RESULT_CHARS
+        body.write(b"]")
+        return to_json({
+            "columns": list(columns),
+            "row_count": count,
+            "truncated": truncated,
+            "limited": count == limit,
+            "rows": orjson.Fragment(body.getvalue()),
+        })
+    
+    async def execute_query(self, args: Dict[str, Any]) -> CallToolResult:
+        """Execute a SQL query"""
+        connection_name = args.get("connection_name", "default")
+        query = args.get("query")
+        queries = args.get("queries") or []
+        params = tuple(args.get("params") or ())
+        fetch_results = args.get("fetch_results", True)
+        limit = args.get("limit", 1000)
+        fetch_size = args.get("fetch_size", CURSOR_PREFETCH)
+        simple = args.get("simple", False)
+        output_format = args.get("format", "table")
+        
+        if connection_name not in self.pools:
+            return text_result(f"No connection found for '{connection_name}'")
+        
+        if bool(query) == bool(queries):
+            return _QUERY_OR_QUERIES_RESULT
+        
+        if len(queries) > MAX_BATCH_STATEMENTS:
+            return _BATCH_LIMIT_RESULT
+        
+        if not args.get("confirm_destructive", False) and any(map(_DESTRUCTIVE_SQL_RE.search, queries or [query])):
+            return _DESTRUCTIVE_RESULT
+        
+        if (simple or queries) and params:
+            return _SIMPLE_PARAMS_RESULT
+        
+        try:
+            if queries:
+                # One simple-protocol script: a single round-trip, run by the server as one transaction.
+                # Separators go on their own line so a trailing -- comment cannot swallow one
+                await self._exec(connection_name, "\n;\n".join(queries), fetch=False)
+                self._invalidate_schema(connection_name)
+                return text_result(f"Batch of {len(queries)} statements executed successfully.")
+            
+            # Without parameters, execute() uses the simple protocol and skips Parse/Describe
+            result_text = await self._query_text(
+                connection_name, query, params, fetch_results and not simple, limit, fetch_size, output_format
+            )
+            # Without fetching or parameters the whole text runs as a simple-protocol
+            # script, which may also hide DDL inside DO blocks or functions
+            if simple or not (fetch_results or params) or _SCHEMA_CHANGE_SQL_RE.search(query):
+                self._invalidate_schema(connection_name)
+            return text_result(result_text)
+        except Exception as e:
+            return text_result(f"Query failed: {str(e)}")
+    
+    async def list_tables(self, args: Dict[str, Any]) -> CallToolResult:
+        """List all tables in the database"""
+        connection_name = args.get("connection_name", "default")
+        schema = args.get("schema", "public")
+        
+        cache_key = (connection_name, "tables", schema)
+        try:
+            result_text = self._cached_schema(cache_key)
+            if result_text is None:
+                result_text = await self._fetch_text(connection_name, LIST_TABLES_SQL, (schema,))
+                self._store_schema(cache_key, result_text)
+            return text_result(result_text)
+        except Exception as e:
+            return text_result(f"Query failed: {str(e)}")
+    
+    async def describe_table(self, args: Dict[str, Any]) -> CallToolResult:
+        """Get detailed table information (columns, indexes and constraints)"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        
+        # Catalog queries run concurrently on separate pooled connections,
+        # so the whole description costs about one round-trip
+        sections = [
+            ("Columns", DESCRIBE_TABLE_SQL),
+            ("Indexes", TABLE_INDEXES_SQL),
+            ("Constraints", TABLE_CONSTRAINTS_SQL),
+        ]
+        
+        cache_key = (connection_name, "table", schema, table_name)
+        try:
+            text = self._cached_schema(cache_key)
+            if text is None:
+                results = await asyncio.gather(*(
+                    self._fetch_text(connection_name, query, (schema, table_name))
+                    for _, query in sections
+                ))
+                text = "\n\n".join(
+                    f"{title}:\n{result}" for (title, _), result in zip(sections, results)
+                )
+                self._store_schema(cache_key, text)
+            return text_result(text)
+        except Exception as e:
+            return text_result(f"Query failed: {str(e)}")
+    
+    async def get_table_data(self, args: Dict[str, Any]) -> CallToolResult:
+        """Get data from a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        limit = args.get("limit", 100)
+        offset = args.get("offset", 0)
+        where_clause = args.get("where_clause", "")
+        order_by = args.get("order_by", "")
+        
+        # Build query
+        query = f"SELECT * FROM {qualified_name(schema, table_name)}"
+        
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        
+        # Bound rather than inlined so every page shares one statement and plan
+        query += " LIMIT $1 OFFSET $2"
+        
+        try:
+            result_text = await self._query_text(connection_name, query, (limit, offset))
+            return text_result(result_text)
+        except Exception as e:
+            return text_result(f"Query failed: {str(e)}")
+    
+    async def create_table(self, args: Dict[str, Any]) -> CallToolResult:
+        """Create a new table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        columns = args["columns"]
+        if_not_exists = args.get("if_not_exists", True)
+        
+        # Build column definitions, reused for repeated column sets
+        spec = tuple(
+            (col['name'], col['type'], col.get('not_null'), col.get('default'), col.get('primary_key'))
+            for col in columns
+        )
+        
+        # Build CREATE TABLE statement
+        if_exists_clause = "IF NOT EXISTS " if if_not_exists else ""
+        query = f"CREATE TABLE {if_exists_clause}{qualified_name(schema, table_name)} ({column_definitions(spec)})"
+        
+        try:
+            await self._exec(connection_name, query, fetch=False)
+            self._invalidate_schema(connection_name)
+            return text_result(f"Table '{schema}.{table_name}' created")
+        except Exception as e:
+            return text_result(f"Create table failed: {str(e)}")
+    
+    async def drop_table(self, args: Dict[str, Any]) -> CallToolResult:
+        """Drop a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        cascade = args.get("cascade", False)
+        if_exists = args.get("if_exists", True)
+        
+        if_exists_clause = "IF EXISTS " if if_exists else ""
+        cascade_clause = " CASCADE" if cascade else ""
+        query = f"DROP TABLE {if_exists_clause}{qualified_name(schema, table_name)}{cascade_clause}"
+        
+        try:
+            await self._exec(connection_name, query, fetch=False)
+            self._invalidate_schema(connection_name)
+            return text_result(f"Table '{schema}.{table_name}' dropped")
+        except Exception as e:
+            return text_result(f"Drop table failed: {str(e)}")
+    
+    async def insert_data(self, args: Dict[str, Any]) -> CallToolResult:
+        """Insert data into a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        data = args["data"]
+        on_conflict = args.get("on_conflict")
+        
+        if not data:
+            return _NO_DATA_RESULT
+        
+        # Rows may carry different keys; batch each distinct column set separately
+        batches: Dict[Tuple[str, ...], List[tuple]] = {}
+        for row in data:
+            batches.setdefault(tuple(row), []).append(tuple(row.values()))
+        
+        try:
+            async with self._pool(connection_name).acquire() as conn:
+                async with conn.transaction():
+                    for columns, records in batches.items():
+                        # COPY cannot express ON CONFLICT, so only bulk loads without it use it.
+                        # Lists may target array columns, which only bound parameters can fill
+                        if (len(records) > COPY_THRESHOLD and not on_conflict
+                                and not any(isinstance(value, list) for record in records for value in record)):
+                            try:
+                                # Savepoint so a refused COPY leaves the transaction usable
+                                async with conn.transaction():
+                                    await conn.copy_to_table(
+                                        table_name, source=io.BytesIO(copy_text(records)),
+                                        columns=list(columns), schema_name=schema
+                                    )
+                                continue
+                            except Exception as e:
+                                # Views take INSERT but not COPY (wrong_object_type);
+                                # asyncpg reports the SQLSTATE as sqlstate, psycopg2 as pgcode
+                                if (getattr(e, "sqlstate", None) or getattr(e, "pgcode", None)) != WRONG_OBJECT_TYPE:
+                                    raise
+                        
+                        await conn.executemany(insert_sql(schema, table_name, columns, on_conflict), records)
+            
+            return text_result(f"Successfully inserted {len(data)} rows")
+        except Exception as e:
+            return text_result(f"Insert failed: {str(e)}")
+    
+    async def update_data(self, args: Dict[str, Any]) -> CallToolResult:
+        """Update data in a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        data = args["data"]
+        where_clause = args["where_clause"]
+        
+        # Build SET clause
+        set_clauses = [f"{quote_ident(col)} = ${i}" for i, col in enumerate(data.keys(), 1)]
+        query = f"UPDATE {qualified_name(schema, table_name)} SET {', '.join(set_clauses)} WHERE {where_clause}"
+        
+        try:
+            _, _, status = await self._exec(connection_name, query, tuple(data.values()), fetch=False)
+            
+            return text_result(f"Successfully updated {affected_rows(status)} rows")
+        except Exception as e:
+            return text_result(f"Update failed: {str(e)}")
+    
+    async def delete_data(self, args: Dict[str, Any]) -> CallToolResult:
+        """Delete data from a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        schema = args.get("schema", "public")
+        where_clause = args["where_clause"]
+        
+        query = f"DELETE FROM {qualified_name(schema, table_name)} WHERE {where_clause}"
+        
+        try:
+            _, _, status = await self._exec(connection_name, query, fetch=False)
+            return text_result(f"Successfully deleted {affected_rows(status)} rows")
+        except Exception as e:
+            return text_result(f"Delete failed: {str(e)}")
+    
+    async def backup_table(self, args: Dict[str, Any]) -> CallToolResult:
+        """Create a backup of a table"""
+        connection_name = args.get("connection_name", "default")
+        table_name = args["table_name"]
+        backup_table_name = args["backup_table_name"]
+        schema = args.get("schema", "public")
+        
+        query = f"CREATE TABLE {qualified_name(schema, backup_table_name)} AS SELECT * FROM {qualified_name(schema, table_name)}"
+        
+        try:
+            _, _, status = await self._exec(connection_name, query, fetch=False)
+            self._invalidate_schema(connection_name)
+            return text_result(f"Backed up {affected_rows(status)} rows from '{schema}.{table_name}' to '{schema}.{backup_table_name}'")
+        except Exception as e:
+            return text_result(f"Backup failed: {str(e)}")
+    
+    async def health_check(self, args: Dict[str, Any]) -> CallToolResult:
+        """Check database connection health"""
+        connection_name = args.get("connection_name", "default")
+        
+        if connection_name not in self.pools:
+            return text_result(f"No connection found for '{connection_name}'")
+        
+        pool = self.pools[connection_name]
+        
+        # Without deep, report local pool state only: it costs no round-trip but
+        # cannot tell whether the server is reachable
+        if not args.get("deep", False):
+            return text_result(
+                f"Connection '{connection_name}' has {pool.get_size()} open pool connections "
+                "(use deep=true to query the server)"
+            )
+        
+        # Reuse a recent success so polling clients don't flood the server;
+        # failures are never cached, so outages surface on the next call
+        now = asyncio.get_running_loop().time()
+        if now - self._health_checked.get(connection_name, float("-inf")) < HEALTH_CACHE_TTL:
+            return text_result(f"Connection '{connection_name}' is healthy")
+        
+        try:
+            async with pool.acquire() as conn:
+                result = await conn.fetchval(HEALTH_SQL)
+            
+            if result == 1:
+                self._health_checked[connection_name] = now
+                return text_result(f"Connection '{connection_name}' is healthy")
+            else:
+                self._health_checked.pop(connection_name, None)
+                return text_result(f"Connection '{connection_name}' health check failed")
+        except Exception as e:
+            self._health_checked.pop(connection_name, None)
+            return text_result(f"Health check failed: {str(e)}")
+    
+    async def run(self):
+        """Run the MCP server"""
+        async with stdio_server() as (read_stream, write_stream):
+            await self.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="postgres-mcp-server",
+                    server_version="1.0.0",
+                    capabilities=self.server.get_capabilities(
+                        notification_options=None,
+                        experimental_capabilities=None,
+                    ),
+                ),
+            )
+
+async def main():
+    """Main entry point"""
+    server = PostgreSQLMCPServer()
+    await server.run()
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        # libuv-based drop-in replacement for the default asyncio event loop
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
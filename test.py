@@ -7,16 +7,13 @@ import asyncio
 import json
 import sys
 import os
+import time
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(__file__))
 
 # Import the MCP server module
-import importlib.util
-spec = importlib.util.spec_from_file_location("postgres_mcp_server", "postgres-mcp-server.py")
-postgres_mcp_server = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(postgres_mcp_server)
-PostgreSQLMCPServer = postgres_mcp_server.PostgreSQLMCPServer
+from postgres_mcp_server import COPY_THRESHOLD, PostgreSQLMCPServer, _DESTRUCTIVE_SQL_RE
 
 async def test_mcp_server():
     """Test the MCP server functionality"""
@@ -25,6 +22,16 @@ async def test_mcp_server():
     # Create server instance
     server = PostgreSQLMCPServer()
     
+    # The guard runs on the event loop for every query, so it must stay fast
+    print("\n0. Testing destructive-statement guard on long whitespace runs...")
+    for query in ("\n" + " " * 5000 + "SELECT * FROM users", "SELECT 1;\n" + " " * 5000 + "SELECT 2"):
+        started = time.perf_counter()
+        assert not _DESTRUCTIVE_SQL_RE.search(query)
+        elapsed = time.perf_counter() - started
+        assert elapsed < 0.1, f"Guard took {elapsed:.3f}s"
+    assert _DESTRUCTIVE_SQL_RE.search("SELECT 1;\n" + " " * 5000 + "DROP TABLE t")
+    print("Guard check passed")
+    
     # Test connection
     print("\n1. Testing database connection...")
     connect_result = await server.connect_database({
@@ -39,7 +46,7 @@ async def test_mcp_server():
     
     # Test health check
     print("\n2. Testing health check...")
-    health_result = await server.health_check({"connection_name": "test"})
+    health_result = await server.health_check({"connection_name": "test", "deep": True})
     print(f"Health check result: {health_result.content[0].text}")
     
     # Test table creation
@@ -68,37 +75,160 @@ async def test_mcp_server():
     })
     print(f"Insert data result: {insert_result.content[0].text}")
     
-    # Test data query
-    print("\n5. Testing data query...")
-    query_result = await server.execute_query({
-        "query": "SELECT * FROM test_users",
-        "connection_name": "test",
-        "fetch_results": True,
-        "limit": 10
+    # JSON argument values must bind to any column type the server can parse them as
+    print("\n4a. Testing JSON argument coercion...")
+    await server.create_table({
+        "table_name": "test_types",
+        "columns": [
+            {"name": "i", "type": "INTEGER"},
+            {"name": "t", "type": "TEXT"},
+            {"name": "b", "type": "BOOLEAN"},
+            {"name": "f", "type": "DOUBLE PRECISION"},
+            {"name": "d", "type": "DATE"}
+        ],
+        "connection_name": "test"
     })
-    print(f"Query result: {query_result.content[0].text}")
-    
-    # Test table listing
-    print("\n6. Testing table listing...")
-    list_result = await server.list_tables({"connection_name": "test"})
-    print(f"List tables result: {list_result.content[0].text}")
+    types_result = await server.insert_data({
+        "table_name": "test_types",
+        "data": [
+            {"i": "42", "t": 42, "b": "true", "f": "1.5", "d": "2024-01-31"},
+            {"i": 7, "t": True, "b": False, "f": 2, "d": None}
+        ],
+        "connection_name": "test"
+    })
+    print(f"Insert result: {types_result.content[0].text}")
+    assert types_result.content[0].text.startswith("Successfully"), types_result.content[0].text
+    update_result = await server.update_data({
+        "table_name": "test_types",
+        "data": {"i": "43", "f": "2.5"},
+        "where_clause": "i = 42",
+        "connection_name": "test"
+    })
+    print(f"Update result: {update_result.content[0].text}")
+    assert update_result.content[0].text == "Successfully updated 1 rows", update_result.content[0].text
+    params_result = await server.execute_query({
+        "query": "SELECT * FROM test_types WHERE i = $1 AND b = $2",
+        "params": ["43", "true"],
+        "connection_name": "test"
+    })
+    print(f"Query result: {params_result.content[0].text}")
+    assert "1 rows returned" in params_result.content[0].text, params_result.content[0].text
     
-    # Test table description
-    print("\n7. Testing table description...")
-    describe_result = await server.describe_table({
+    # Past COPY_THRESHOLD a column set is loaded with COPY; smaller sets use executemany
+    print("\n4b. Testing bulk insertion...")
+    bulk_rows = [
+        {"name": f"Bulk User {i}", "email": f"bulk{i}@example.com"}
+        for i in range(COPY_THRESHOLD + 1)
+    ]
+    bulk_rows.append({"name": "Dated User", "email": "dated@example.com", "created_at": "2024-01-31 12:00:00"})
+    bulk_result = await server.insert_data({
         "table_name": "test_users",
+        "data": bulk_rows,
         "connection_name": "test"
     })
+    print(f"Bulk insert result: {bulk_result.content[0].text}")
+    assert bulk_result.content[0].text == f"Successfully inserted {len(bulk_rows)} rows", bulk_result.content[0].text
+    
+    # Views accept INSERT but not COPY, so the bulk path falls back to executemany
+    print("\n4c. Testing bulk insertion into a view...")
+    await server.execute_query({
+        "query": "CREATE VIEW test_users_view AS SELECT name, email FROM test_users",
+        "fetch_results": False,
+        "connection_name": "test"
+    })
+    view_result = await server.insert_data({
+        "table_name": "test_users_view",
+        "data": bulk_rows[:COPY_THRESHOLD + 1],
+        "connection_name": "test"
+    })
+    print(f"View insert result: {view_result.content[0].text}")
+    assert view_result.content[0].text == f"Successfully inserted {COPY_THRESHOLD + 1} rows", view_result.content[0].text
+    
+    # A queries batch runs as one script in a single round-trip
+    print("\n4d. Testing statement batch...")
+    batch_result = await server.execute_query({
+        "queries": [
+            "CREATE TABLE test_batch (a INTEGER) -- trailing comment",
+            "INSERT INTO test_batch VALUES (1)",
+            "INSERT INTO test_batch VALUES (2)"
+        ],
+        "connection_name": "test"
+    })
+    print(f"Batch result: {batch_result.content[0].text}")
+    assert batch_result.content[0].text == "Batch of 3 statements executed successfully.", batch_result.content[0].text
+    
+    # DDL later in a script must still invalidate cached list_tables output
+    await server.list_tables({"connection_name": "test"})
+    await server.execute_query({
+        "query": "SELECT 1; CREATE TABLE test_script (a INTEGER)",
+        "fetch_results": False,
+        "connection_name": "test"
+    })
+    script_list = await server.list_tables({"connection_name": "test"})
+    print(f"List tables after script: {script_list.content[0].text}")
+    assert "test_script" in script_list.content[0].text, script_list.content[0].text
+    
+    # Indented multi-line SQL must not stall the destructive-statement guard
+    print("\n4e. Testing indented multi-line query...")
+    indented_result = await server.execute_query({
+        "query": """
+                    SELECT name, email
+                      FROM test_users
+                     WHERE name LIKE $1
+                     ORDER BY name
+        """,
+        "params": ["Bulk User 1%"],
+        "connection_name": "test",
+        "limit": 5
+    })
+    print(f"Indented query result: {indented_result.content[0].text}")
+    assert "5 rows returned" in indented_result.content[0].text, indented_result.content[0].text
+    
+    # Empty results still report their column names
+    empty_result = await server.execute_query({
+        "query": "SELECT name, email FROM test_users WHERE false",
+        "format": "json",
+        "connection_name": "test"
+    })
+    print(f"Empty JSON result: {empty_result.content[0].text}")
+    assert json.loads(empty_result.content[0].text)["columns"] == ["name", "email"], empty_result.content[0].text
+    
+    # Read-only checks are independent, so run them concurrently on the pool
+    print("\n5-7. Testing data query, table listing and table description...")
+    query_result, list_result, describe_result = await asyncio.gather(
+        server.execute_query({
+            "query": "SELECT * FROM test_users",
+            "connection_name": "test",
+            "fetch_results": True,
+            "limit": 10
+        }),
+        server.list_tables({"connection_name": "test"}),
+        server.describe_table({
+            "table_name": "test_users",
+            "connection_name": "test"
+        })
+    )
+    print(f"Query result: {query_result.content[0].text}")
+    print(f"List tables result: {list_result.content[0].text}")
     print(f"Describe table result: {describe_result.content[0].text}")
     
     # Test cleanup
     print("\n8. Testing cleanup...")
+    await server.execute_query({
+        "query": "DROP VIEW IF EXISTS test_users_view",
+        "fetch_results": False,
+        "confirm_destructive": True,
+        "connection_name": "test"
+    })
     drop_result = await server.drop_table({
         "table_name": "test_users",
         "connection_name": "test",
         "if_exists": True
     })
     print(f"Drop table result: {drop_result.content[0].text}")
+    await server.drop_table({"table_name": "test_types", "connection_name": "test"})
+    await server.drop_table({"table_name": "test_batch", "connection_name": "test"})
+    await server.drop_table({"table_name": "test_script", "connection_name": "test"})
     
     # Test disconnection
     print("\n9. Testing disconnection...")